@@ -5,24 +5,37 @@ Automatically fetches, filters, and generates PDF reports for arXiv papers
 """
 
 import argparse
+import atexit
 import logging
+import queue
+import signal
 import sys
 import os
+import threading
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-import yaml
+from typing import Optional
 
 # Add modules to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from modules import (
-    ArxivFetcher,
-    PaperFilter,
-    LatexGenerator,
-    PdfCompiler,
-    PaperScheduler
-)
-from modules.notifications import NotificationManager, send_test_notification
+
+# Background thread writing queued log records, see setup_logging
+_log_listener: Optional[QueueListener] = None
+
+
+def _stop_log_listener():
+    """Flush queued log records and stop the logging listener thread"""
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        for handler in _log_listener.handlers:
+            handler.close()
+        _log_listener = None
+
+
+atexit.register(_stop_log_listener)
 
 
 def setup_logging(config: dict) -> logging.Logger:
@@ -35,6 +48,8 @@ def setup_logging(config: dict) -> logging.Logger:
     Returns:
         Configured logger
     """
+    from modules import ConfigLoader
+
     log_config = config.get("logging", {})
     log_level = getattr(logging, log_config.get("level", "INFO"))
     log_file = log_config.get("log_file", "output/collector.log")
@@ -44,8 +59,9 @@ def setup_logging(config: dict) -> logging.Logger:
     logger = logging.getLogger("ArXivCollector")
     logger.setLevel(log_level)
 
-    # Remove existing handlers
+    # Remove existing handlers; records must not also reach root handlers
     logger.handlers = []
+    logger.propagate = False
 
     # Create formatters
     try:
@@ -72,86 +88,61 @@ def setup_logging(config: dict) -> logging.Logger:
         datefmt="%Y-%m-%d %H:%M:%S"
     )
 
+    # Handlers run on a background listener thread; logging calls only enqueue
+    handlers = []
+
     # Console handler
     if console_output:
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setFormatter(console_formatter)
-        logger.addHandler(console_handler)
+        handlers.append(console_handler)
 
     # File handler
-    log_dir = os.path.dirname(log_file)
-    if log_dir:
-        os.makedirs(log_dir, exist_ok=True)
+    ConfigLoader.ensure_dir(os.path.dirname(log_file))
 
-    file_handler = logging.FileHandler(log_file, encoding='utf-8')
+    file_handler = logging.FileHandler(log_file, encoding='utf-8', delay=True)
     file_handler.setFormatter(file_formatter)
-    logger.addHandler(file_handler)
+    handlers.append(file_handler)
 
-    return logger
+    _stop_log_listener()
 
+    global _log_listener
+    log_queue = queue.Queue(-1)
+    logger.addHandler(QueueHandler(log_queue))
+    _log_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _log_listener.start()
 
-def load_config(config_path: str = "config.yaml") -> dict:
-    """
-    Load configuration from YAML file
+    return logger
 
-    Args:
-        config_path: Path to configuration file
 
-    Returns:
-        Configuration dictionary
-    """
-    try:
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = yaml.safe_load(f)
-        return config
-    except FileNotFoundError:
-        print(f"Warning: Config file not found: {config_path}. Using defaults.")
-        return get_default_config()
-    except Exception as e:
-        print(f"Error loading config: {e}. Using defaults.")
-        return get_default_config()
-
-
-def get_default_config() -> dict:
-    """Get default configuration"""
-    return {
-        "keywords": {
-            "electronic_structure": ["electronic structure", "DFT", "quantum chemistry"],
-            "artificial_intelligence": ["machine learning", "neural network", "AI"]
-        },
-        "arxiv_categories": ["physics.comp-ph", "physics.chem-ph", "cs.LG"],
-        "days_back": 1,
-        "schedule": {"hour": 10, "minute": 0},
-        "output": {
-            "pdf_dir": "output/papers",
-            "latex_dir": "output/latex"
-        },
-        "latex": {
-            "engine": "pdflatex",
-            "max_compile_time": 60,
-            "attempts": 2
-        },
-        "max_papers": 50,
-        "abstract_max_length": 1000,
-        "logging": {
-            "level": "INFO",
-            "log_file": "output/collector.log",
-            "console_output": True
-        }
-    }
-
-
-def run_collector(config: dict, logger: logging.Logger) -> bool:
+def run_collector(
+    config: dict,
+    logger: logging.Logger,
+    use_cache: bool = True,
+    jobs: Optional[int] = None
+) -> bool:
     """
     Run the paper collection pipeline
 
     Args:
         config: Configuration dictionary
         logger: Logger instance
+        use_cache: Whether to reuse today's cached arXiv results
+        jobs: Maximum number of parallel LaTeX compilations (CPU count if None)
 
     Returns:
         True if successful, False otherwise
     """
+    # Imported here so commands that don't collect skip loading arxiv, jinja2, etc.
+    from modules import (
+        ArxivFetcher,
+        PaperFilter,
+        LatexGenerator,
+        PdfCompiler,
+        NotificationManager,
+        ConfigLoader
+    )
+
     try:
         logger.info("=" * 60)
         logger.info("Starting ArXiv Paper Collector")
@@ -161,20 +152,28 @@ def run_collector(config: dict, logger: logging.Logger) -> bool:
         output_config = config.get("output", {})
         pdf_dir = output_config.get("pdf_dir", "output/papers")
         latex_dir = output_config.get("latex_dir", "output/latex")
+        cache_dir = output_config.get("cache_dir", "output/.cache/arxiv")
+        seen_db = output_config.get("seen_db", "output/.cache/seen.db")
 
-        os.makedirs(pdf_dir, exist_ok=True)
-        os.makedirs(latex_dir, exist_ok=True)
+        ConfigLoader.ensure_dir(pdf_dir)
+        ConfigLoader.ensure_dir(latex_dir)
 
         # Step 1: Fetch papers from arXiv
         logger.info("Step 1: Fetching papers from arXiv...")
         fetcher = ArxivFetcher(
             categories=config.get("arxiv_categories", []),
             days_back=config.get("days_back", 1),
-            max_results=100
+            max_results=config.get("max_results", 100),
+            cache_dir=cache_dir if use_cache else None,
+            seen_db=seen_db if config.get("incremental", False) else None
         )
         papers = fetcher.fetch_papers()
 
         if not papers:
+            if fetcher.seen_skipped:
+                # Incremental mode: everything fetched was already reported
+                logger.info("No new papers since the last run. Nothing to do.")
+                return True
             logger.warning("No papers found. Exiting.")
             return False
 
@@ -189,34 +188,63 @@ def run_collector(config: dict, logger: logging.Logger) -> bool:
         for group_name, group_papers in grouped_papers.items():
             logger.info(f"  {group_name}: {len(group_papers)} papers")
 
-        # Step 3: Generate LaTeX document
+        # Step 3: Generate LaTeX document(s)
         logger.info("Step 3: Generating LaTeX document...")
         latex_gen = LatexGenerator()
 
         date_str = datetime.now().strftime("%Y-%m-%d")
-        latex_filename = f"arxiv_papers_{date_str}.tex"
-        latex_path = os.path.join(latex_dir, latex_filename)
-
-        latex_gen.generate_latex(
-            papers=grouped_papers,
-            output_path=latex_path,
-            max_papers=config.get("max_papers", 50),
-            abstract_max_length=config.get("abstract_max_length", 1000)
-        )
 
-        # Step 4: Compile PDF
+        # Either one combined report, or one report per non-empty group
+        if output_config.get("split_by_group", False):
+            reports = [
+                (os.path.join(latex_dir, f"arxiv_{group_name}_{date_str}.tex"), {group_name: group_papers})
+                for group_name, group_papers in grouped_papers.items()
+                if group_papers
+            ]
+        else:
+            latex_filename = f"arxiv_papers_{date_str}.tex"
+            reports = [(os.path.join(latex_dir, latex_filename), grouped_papers)]
+
+        max_papers = config.get("max_papers", 50)
+        for latex_path, report_papers in reports:
+            latex_gen.generate_latex(
+                papers=report_papers,
+                output_path=latex_path,
+                max_papers=max_papers,
+                abstract_max_length=config.get("abstract_max_length", 1000)
+            )
+
+        # Papers that made it into a report (groups are truncated to max_papers)
+        rendered_papers = list({
+            paper["arxiv_id"]: paper
+            for _, report_papers in reports
+            for group_papers in report_papers.values()
+            for paper in group_papers[:max_papers]
+        }.values())
+
+        # Step 4: Compile PDF(s)
         logger.info("Step 4: Compiling PDF...")
         latex_config = config.get("latex", {})
         compiler = PdfCompiler(
             engine=latex_config.get("engine", "pdflatex"),
             max_compile_time=latex_config.get("max_compile_time", 60),
-            attempts=latex_config.get("attempts", 2)
+            attempts=latex_config.get("attempts", 2),
+            draft_intermediate=latex_config.get("draft_intermediate", True)
         )
 
-        pdf_path = compiler.compile(latex_path, output_dir=pdf_dir)
+        latex_paths = [latex_path for latex_path, _ in reports]
+        pdf_paths = compiler.batch_compile(latex_paths, output_dir=pdf_dir, max_workers=jobs)
+
+        if pdf_paths and len(pdf_paths) == len(latex_paths):
+            pdf_path = pdf_paths[0] if len(pdf_paths) == 1 else pdf_dir
+        else:
+            pdf_path = None
 
         if pdf_path:
             logger.info(f"PDF generated successfully: {pdf_path}")
+
+            # Only now are these papers reported; a failed run leaves them unseen
+            fetcher.mark_seen(rendered_papers)
             logger.info("=" * 60)
             logger.info("Collection completed successfully!")
             logger.info("=" * 60)
@@ -288,6 +316,19 @@ Examples:
         help="Path to configuration file (default: config.yaml)"
     )
 
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore cached arXiv results and fetch fresh data"
+    )
+
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=None,
+        help="Number of LaTeX reports to compile in parallel (default: CPU count)"
+    )
+
     parser.add_argument(
         "--status", "-s",
         action="store_true",
@@ -315,7 +356,9 @@ Examples:
     args = parser.parse_args()
 
     # Load configuration
-    config = load_config(args.config)
+    from modules import ConfigLoader
+
+    config = ConfigLoader.load_config(args.config)
     logger = setup_logging(config)
 
     # Handle --edit-keywords
@@ -327,6 +370,8 @@ Examples:
 
     # Handle --test-notify
     if args.test_notify:
+        from modules import send_test_notification
+
         print("Sending test notification...")
         notification_config = config.get("notifications", {})
         success = send_test_notification(notification_config)
@@ -359,11 +404,13 @@ Examples:
 
     # Handle --run
     if args.run:
-        success = run_collector(config, logger)
+        success = run_collector(config, logger, use_cache=not args.no_cache, jobs=args.jobs)
         sys.exit(0 if success else 1)
 
     # Handle --daemon
     if args.daemon:
+        from modules import PaperScheduler
+
         logger.info("Starting daemon mode...")
         schedule_config = config.get("schedule", {})
         scheduler = PaperScheduler(
@@ -372,21 +419,26 @@ Examples:
         )
 
         # Schedule daily task
-        scheduler.schedule_daily(lambda: run_collector(config, logger))
+        scheduler.schedule_daily(lambda: run_collector(config, logger, use_cache=not args.no_cache, jobs=args.jobs))
 
         # Start scheduler
         scheduler.start()
         logger.info(f"Scheduler running. Next run at {schedule_config.get('hour', 10):02d}:{schedule_config.get('minute', 0):02d}")
         logger.info("Press Ctrl+C to stop...")
 
-        try:
-            while True:
-                import time
-                time.sleep(60)
-        except KeyboardInterrupt:
-            logger.info("Shutting down...")
-            scheduler.stop()
-            sys.exit(0)
+        # Block until a shutdown signal arrives instead of waking up periodically
+        stop_event = threading.Event()
+        signal.signal(signal.SIGINT, lambda *_: stop_event.set())
+        signal.signal(signal.SIGTERM, lambda *_: stop_event.set())
+
+        # Ctrl+C cannot interrupt a lock wait on Windows, so wake up periodically there
+        wait_timeout = 1.0 if os.name == 'nt' else None
+        while not stop_event.wait(wait_timeout):
+            pass
+
+        logger.info("Shutting down...")
+        scheduler.stop()
+        sys.exit(0)
 
     # Default: show help
     parser.print_help()
@@ -2,16 +2,33 @@
 Arxiv Paper Collector - Modules Package
 """
 
+import importlib
+from typing import TYPE_CHECKING
+
 __version__ = "1.0.0"
 __author__ = "Jiaoyuan"
 
-from .arxiv_fetcher import ArxivFetcher
-from .paper_filter import PaperFilter
-from .latex_generator import LatexGenerator
-from .pdf_compiler import PdfCompiler
-from .scheduler import PaperScheduler
-from .notifications import NotificationManager, send_test_notification
-from .config_loader import ConfigLoader
+# Public names and the submodule defining them. Submodules are imported on
+# first access so lightweight commands don't pay for arxiv, jinja2, etc.
+_LAZY_IMPORTS = {
+    "ArxivFetcher": ".arxiv_fetcher",
+    "PaperFilter": ".paper_filter",
+    "LatexGenerator": ".latex_generator",
+    "PdfCompiler": ".pdf_compiler",
+    "PaperScheduler": ".scheduler",
+    "NotificationManager": ".notifications",
+    "send_test_notification": ".notifications",
+    "ConfigLoader": ".config_loader",
+}
+
+if TYPE_CHECKING:
+    from .arxiv_fetcher import ArxivFetcher
+    from .paper_filter import PaperFilter
+    from .latex_generator import LatexGenerator
+    from .pdf_compiler import PdfCompiler
+    from .scheduler import PaperScheduler
+    from .notifications import NotificationManager, send_test_notification
+    from .config_loader import ConfigLoader
 
 __all__ = [
     "ArxivFetcher",
@@ -23,3 +40,18 @@ __all__ = [
     "send_test_notification",
     "ConfigLoader",
 ]
+
+
+def __getattr__(name: str):
+    """Import public classes from their submodule on first access"""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_IMPORTS))
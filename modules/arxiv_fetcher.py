@@ -4,15 +4,65 @@ Fetches papers from arXiv API based on categories and date range
 """
 
 import arxiv
-from datetime import datetime, timedelta, timezone
-from typing import List, Dict, Optional
+import functools
+import hashlib
+import json
+import sqlite3
+import time
+from contextlib import closing
+from datetime import date, datetime, timedelta, timezone
+from operator import attrgetter
+from pathlib import Path
+from typing import Iterable, List, Dict, Optional, Tuple
 import logging
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# arXiv asks automated clients to use the export mirror for API traffic
+ARXIV_EXPORT_URL = "https://export.arxiv.org/api/query?{}"
+
+# Largest page size accepted by the arXiv API
+ARXIV_MAX_PAGE_SIZE = 2000
+
+# arXiv publishes new listings once per day, so cached results stay valid for a day
+CACHE_MAX_AGE = 24 * 60 * 60
+
+# Paper fields that decide whether a previously seen paper has changed
+HASHED_FIELDS = ("title", "summary", "authors")
+
+# Keep IN (...) lookups below SQLite's default host parameter limit
+SQLITE_BATCH_SIZE = 500
+
+_author_name = attrgetter("name")
+
+
+@functools.lru_cache(maxsize=32)
+def _build_category_query(categories: Tuple[str, ...]) -> str:
+    """Build the OR'ed arXiv query clause for a set of categories"""
+    return " OR ".join(f"cat:{category}" for category in categories)
+
+
+@functools.lru_cache(maxsize=32)
+def _build_keyword_query(keywords: Tuple[str, ...]) -> str:
+    """Build the OR'ed arXiv query clause for a set of keywords"""
+    return " OR ".join(f'all:"{keyword}"' for keyword in keywords)
+
 
 class ArxivFetcher:
     """Fetches papers from arXiv API"""
 
-    def __init__(self, categories: List[str], days_back: int = 1, max_results: int = 100):
+    def __init__(
+        self,
+        categories: List[str],
+        days_back: int = 1,
+        max_results: int = 100,
+        cache_dir: Optional[str] = None,
+        seen_db: Optional[str] = None
+    ):
         """
         Initialize the arXiv fetcher
 
@@ -20,57 +70,283 @@ class ArxivFetcher:
             categories: List of arXiv categories (e.g., ["cs.AI", "physics.chem-ph"])
             days_back: Number of days back from today to search
             max_results: Maximum number of results to fetch
+            cache_dir: Directory for caching daily fetch results (disabled if None)
+            seen_db: SQLite file recording hashes of already processed papers.
+                     If set, only new or changed papers are returned.
         """
         self.categories = categories
         self.days_back = days_back
         self.max_results = max_results
+        self.cache_dir = cache_dir
+        self.seen_db = seen_db
         self.logger = logging.getLogger(__name__)
 
-    def fetch_papers(self) -> List[Dict]:
+        # Papers dropped by the last fetch because they were already seen unchanged
+        self.seen_skipped = 0
+
+        # Category part of every query, built once
+        self._cat_query = _build_category_query(tuple(categories))
+
+    def fetch_papers(self, force_full: bool = False) -> List[Dict]:
         """
         Fetch papers from arXiv published within the specified date range
 
+        Args:
+            force_full: Return all papers even if they were already seen
+                        unchanged in a previous run (only relevant with seen_db)
+
         Returns:
             List of paper dictionaries containing title, authors, abstract, etc.
         """
+        cache_path = self._get_cache_path()
+        papers = self._load_cache(cache_path) if cache_path is not None else None
+
+        if papers is not None:
+            self.logger.info(f"Loaded {len(papers)} papers from cache: {cache_path}")
+        else:
+            papers = self._fetch_from_arxiv()
+
+            # Don't cache empty results, they are most likely a failed request
+            if cache_path is not None and papers:
+                self._save_cache(cache_path, papers)
+
+        if self.seen_db:
+            papers = self._diff_against_seen(papers, force_full)
+
+        return papers
+
+    def _fetch_from_arxiv(self) -> List[Dict]:
+        """
+        Query the arXiv API for all configured categories
+
+        Returns:
+            List of unique paper dictionaries
+        """
+        if not self.categories:
+            self.logger.warning("No arXiv categories configured, nothing to fetch")
+            return []
+
         # Calculate date range (use timezone-aware datetime)
         end_date = datetime.now(timezone.utc)
         start_date = end_date - timedelta(days=self.days_back)
 
         self.logger.info(f"Fetching papers from {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}")
 
+        date_filter = self._build_date_filter(start_date, end_date)
+
+        # A single OR'ed query replaces one round-trip (and rate-limit delay) per category
+        query = f"({self._cat_query}) AND {date_filter}"
+        self.logger.info(f"Searching categories: {', '.join(self.categories)}")
+
         papers = []
 
-        # Build query string for each category
-        for category in self.categories:
-            query = f"cat:{category}"
-            self.logger.info(f"Searching category: {category}")
-
-            try:
-                # Create search object
-                search = arxiv.Search(
-                    query=query,
-                    max_results=self.max_results,
-                    sort_by=arxiv.SortCriterion.SubmittedDate,
-                    sort_order=arxiv.SortOrder.Descending
+        try:
+            # Keep the same result budget the per-category searches had
+            max_results = self.max_results * max(1, len(self.categories))
+            client = self._create_client(max_results)
+
+            # Create search object
+            search = arxiv.Search(
+                query=query,
+                max_results=max_results,
+                sort_by=arxiv.SortCriterion.SubmittedDate,
+                sort_order=arxiv.SortOrder.Descending
+            )
+
+            # Fetch results (the date window is already applied by arXiv)
+            self._collect_unique(client.results(search), papers)
+
+        except Exception as e:
+            self.logger.error(f"Error fetching from categories {self.categories}: {e}")
+
+        self.logger.info(f"Found {len(papers)} unique papers")
+
+        return papers
+
+    def _diff_against_seen(self, papers: List[Dict], force_full: bool = False) -> List[Dict]:
+        """
+        Drop papers whose content is unchanged since they were last processed
+
+        Read-only: papers are only recorded by mark_seen, once their report exists.
+
+        Args:
+            papers: List of unique paper dictionaries
+            force_full: Keep every paper
+
+        Returns:
+            List of new or changed papers (all papers if force_full)
+        """
+        self.seen_skipped = 0
+        if force_full or not Path(self.seen_db).exists():
+            return papers
+
+        try:
+            with closing(sqlite3.connect(self.seen_db)) as conn:
+                stored = {}
+                ids = [paper["arxiv_id"] for paper in papers]
+                for i in range(0, len(ids), SQLITE_BATCH_SIZE):
+                    batch = ids[i:i + SQLITE_BATCH_SIZE]
+                    placeholders = ",".join("?" * len(batch))
+                    stored.update(conn.execute(
+                        f"SELECT arxiv_id, hash FROM seen WHERE arxiv_id IN ({placeholders})",
+                        batch
+                    ))
+        except Exception as e:
+            self.logger.warning(f"Could not use seen-paper database {self.seen_db}: {e}")
+            return papers
+
+        changed_papers = [
+            paper for paper in papers
+            if stored.get(paper["arxiv_id"]) != self._hash_paper(paper)
+        ]
+        self.seen_skipped = len(papers) - len(changed_papers)
+        self.logger.info(
+            f"Skipped {self.seen_skipped} unchanged papers, "
+            f"{len(changed_papers)} new or updated"
+        )
+
+        return changed_papers
+
+    def mark_seen(self, papers: List[Dict]):
+        """
+        Record papers as processed so later incremental runs skip them
+
+        Call this only after the report for these papers has been produced,
+        otherwise a failed run would drop them from every future report.
+
+        Args:
+            papers: List of paper dictionaries that were reported
+        """
+        if not self.seen_db or not papers:
+            return
+
+        try:
+            Path(self.seen_db).parent.mkdir(parents=True, exist_ok=True)
+            with closing(sqlite3.connect(self.seen_db)) as conn, conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS seen (arxiv_id TEXT PRIMARY KEY, hash BLOB)"
                 )
+                conn.executemany(
+                    "INSERT OR REPLACE INTO seen (arxiv_id, hash) VALUES (?, ?)",
+                    ((paper["arxiv_id"], self._hash_paper(paper)) for paper in papers)
+                )
+        except Exception as e:
+            self.logger.warning(f"Could not update seen-paper database {self.seen_db}: {e}")
 
-                # Fetch results
-                for result in search.results():
-                    # Check if paper is within date range
-                    if result.published >= start_date and result.published <= end_date:
-                        paper = self._parse_paper(result)
-                        papers.append(paper)
+    @staticmethod
+    def _hash_paper(paper: Dict) -> bytes:
+        """
+        Hash the fields of a paper that identify a content change
 
-            except Exception as e:
-                self.logger.error(f"Error fetching from category {category}: {e}")
-                continue
+        Args:
+            paper: Paper dictionary
+
+        Returns:
+            SHA-256 digest of the hashed fields
+        """
+        content = json.dumps(
+            {field: paper.get(field) for field in HASHED_FIELDS},
+            sort_keys=True,
+            default=str
+        )
+        return hashlib.sha256(content.encode("utf-8")).digest()
+
+    def _get_cache_path(self) -> Optional[Path]:
+        """
+        Get the cache file for today's fetch of the configured categories
+
+        Returns:
+            Path to the cache file, or None if caching is disabled
+        """
+        if not self.cache_dir:
+            return None
+
+        key_source = f"{sorted(self.categories)}|{self.days_back}|{self.max_results}|{date.today()}"
+        key = hashlib.sha256(key_source.encode("utf-8")).hexdigest()
+        return Path(self.cache_dir) / f"{key}.json"
+
+    def _load_cache(self, cache_path: Path) -> Optional[List[Dict]]:
+        """
+        Load cached papers if the cache file exists and is fresh
+
+        Args:
+            cache_path: Path to the cache file
+
+        Returns:
+            List of cached papers, or None on a cache miss
+        """
+        try:
+            if time.time() - cache_path.stat().st_mtime >= CACHE_MAX_AGE:
+                return None
+            if orjson is not None:
+                papers = orjson.loads(cache_path.read_bytes())
+            else:
+                papers = json.loads(cache_path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            self.logger.warning(f"Could not read cache {cache_path}: {e}")
+            return None
+
+        for paper in papers:
+            paper["published"] = datetime.fromisoformat(paper["published"])
+
+        return papers
+
+    def _save_cache(self, cache_path: Path, papers: List[Dict]):
+        """
+        Save fetched papers to the cache
+
+        Args:
+            cache_path: Path to the cache file
+            papers: List of paper dictionaries
+        """
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            if orjson is not None:
+                cache_path.write_bytes(orjson.dumps(papers))
+            else:
+                cache_path.write_text(
+                    json.dumps(papers, default=lambda obj: obj.isoformat()),
+                    encoding="utf-8"
+                )
+        except Exception as e:
+            self.logger.warning(f"Could not write cache {cache_path}: {e}")
+
+    @staticmethod
+    def _build_date_filter(start_date: datetime, end_date: datetime) -> str:
+        """
+        Build an arXiv query clause restricting results to a submission window
+
+        Args:
+            start_date: Start of the date range (UTC)
+            end_date: End of the date range (UTC)
+
+        Returns:
+            submittedDate range clause for the arXiv query language
+        """
+        return f"submittedDate:[{start_date:%Y%m%d%H%M} TO {end_date:%Y%m%d%H%M}]"
+
+    def _create_client(self, max_results: Optional[int] = None) -> arxiv.Client:
+        """
+        Create an arXiv API client pointed at the export mirror
 
-        # Remove duplicates based on arXiv ID
-        unique_papers = self._remove_duplicates(papers)
-        self.logger.info(f"Found {len(unique_papers)} unique papers")
+        Args:
+            max_results: Expected number of results (defaults to max_results)
 
-        return unique_papers
+        Returns:
+            arXiv Client configured to fetch all results in as few pages as possible
+        """
+        if max_results is None:
+            max_results = self.max_results
+
+        client = arxiv.Client(
+            page_size=min(max_results, ARXIV_MAX_PAGE_SIZE),
+            delay_seconds=3.0,
+            num_retries=5
+        )
+        client.query_url_format = ARXIV_EXPORT_URL
+        return client
 
     def _parse_paper(self, result: arxiv.Result) -> Dict:
         """
@@ -82,38 +358,42 @@ class ArxivFetcher:
         Returns:
             Dictionary containing paper information
         """
+        title = result.title
+        summary = result.summary.replace("\n", " ")
+
         return {
-            "title": result.title,
-            "authors": [author.name for author in result.authors],
-            "summary": result.summary.replace("\n", " "),
+            "title": title,
+            "authors": list(map(_author_name, result.authors)),
+            "summary": summary,
             "published": result.published,
-            "arxiv_id": result.entry_id.split("/")[-1],
+            "arxiv_id": result.entry_id.rpartition("/")[2],
             "url": result.entry_id,
             "pdf_url": result.pdf_url,
             "categories": result.categories,
-            "primary_category": result.primary_category
+            "primary_category": result.primary_category,
+            # Case-folded once here so keyword filters don't lowercase per keyword
+            "_search": (title + " " + summary).lower()
         }
 
-    def _remove_duplicates(self, papers: List[Dict]) -> List[Dict]:
+    def _collect_unique(self, results: Iterable[arxiv.Result], papers: List[Dict]):
         """
-        Remove duplicate papers based on arXiv ID
+        Parse streamed results into papers, skipping duplicate arXiv IDs
 
-        Args:
-            papers: List of paper dictionaries
+        Papers are appended as they arrive so results parsed before a
+        network error are kept.
 
-        Returns:
-            List of unique papers
+        Args:
+            results: Iterable of arXiv Result objects
+            papers: List to append unique paper dictionaries to
         """
-        seen_ids = set()
-        unique_papers = []
+        seen_ids = {paper["arxiv_id"] for paper in papers}
 
-        for paper in papers:
-            arxiv_id = paper["arxiv_id"]
-            if arxiv_id not in seen_ids:
-                seen_ids.add(arxiv_id)
-                unique_papers.append(paper)
-
-        return unique_papers
+        for result in results:
+            arxiv_id = result.entry_id.rpartition("/")[2]
+            if arxiv_id in seen_ids:
+                continue
+            seen_ids.add(arxiv_id)
+            papers.append(self._parse_paper(result))
 
     def fetch_by_keywords(self, keywords: List[str], categories: Optional[List[str]] = None) -> List[Dict]:
         """
@@ -127,7 +407,9 @@ class ArxivFetcher:
             List of matching papers
         """
         if categories is None:
-            categories = self.categories
+            cat_query = self._cat_query
+        else:
+            cat_query = _build_category_query(tuple(categories))
 
         # Calculate date range (use timezone-aware datetime)
         end_date = datetime.now(timezone.utc)
@@ -137,17 +419,17 @@ class ArxivFetcher:
 
         papers = []
 
-        # Build query with keywords
-        query_parts = []
-        for keyword in keywords:
-            query_parts.append(f'all:"{keyword}"')
-        query = " OR ".join(query_parts)
-
-        # Add category filter
-        cat_query = " OR ".join([f"cat:{cat}" for cat in categories])
-        full_query = f"({query}) AND ({cat_query})"
+        # Build query with keywords and category filter
+        query = _build_keyword_query(tuple(keywords))
+        date_filter = self._build_date_filter(start_date, end_date)
+        if cat_query:
+            full_query = f"({query}) AND ({cat_query}) AND {date_filter}"
+        else:
+            # No categories: search keywords across all of arXiv
+            full_query = f"({query}) AND {date_filter}"
 
         try:
+            client = self._create_client()
             search = arxiv.Search(
                 query=full_query,
                 max_results=self.max_results,
@@ -155,16 +437,11 @@ class ArxivFetcher:
                 sort_order=arxiv.SortOrder.Descending
             )
 
-            for result in search.results():
-                if result.published >= start_date and result.published <= end_date:
-                    paper = self._parse_paper(result)
-                    papers.append(paper)
+            self._collect_unique(client.results(search), papers)
 
         except Exception as e:
             self.logger.error(f"Error fetching by keywords: {e}")
 
-        # Remove duplicates
-        unique_papers = self._remove_duplicates(papers)
-        self.logger.info(f"Found {len(unique_papers)} papers matching keywords")
+        self.logger.info(f"Found {len(papers)} papers matching keywords")
 
-        return unique_papers
+        return papers
@@ -3,12 +3,22 @@ Configuration Loader Module
 Handles loading configuration from multiple locations with portability support
 """
 
+import copy
+import functools
 import os
 import yaml
 from pathlib import Path
 from typing import Optional, Dict
 import logging
 
+# Prefer the libyaml C parser when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+logger = logging.getLogger(__name__)
+
 
 class ConfigLoader:
     """Load configuration from multiple locations with fallback support"""
@@ -23,6 +33,9 @@ class ConfigLoader:
         "{config_dir}/arxiv-collector/config.yaml",
     ]
 
+    # Config file found per working directory, reused by find_config_file
+    _found_configs: Dict[str, str] = {}
+
     @staticmethod
     def get_config_dir() -> str:
         """Get platform-specific config directory"""
@@ -51,21 +64,29 @@ class ConfigLoader:
         """
         # If explicit path provided, try it first
         if config_path:
-            if os.path.exists(config_path):
+            if os.path.isfile(config_path):
                 return config_path
             print(f"Warning: Config file not found: {config_path}")
 
-        # Try standard locations
+        # Reuse the location found earlier for this working directory
         cwd = os.getcwd()
+        cached = cls._found_configs.get(cwd)
+        if cached and os.path.isfile(cached):
+            return cached
+
+        # Try standard locations, stopping at the first hit
         home = str(Path.home())
         config_dir = cls.get_config_dir()
+        candidates = (
+            location_template.format(cwd=cwd, home=home, config_dir=config_dir)
+            for location_template in cls.CONFIG_LOCATIONS
+        )
+        location = next((path for path in candidates if os.path.isfile(path)), None)
 
-        for location_template in cls.CONFIG_LOCATIONS:
-            location = location_template.format(cwd=cwd, home=home, config_dir=config_dir)
-            if os.path.exists(location):
-                return location
+        if location:
+            cls._found_configs[cwd] = location
 
-        return None
+        return location
 
     @classmethod
     def load_config(cls, config_path: Optional[str] = None) -> Dict:
@@ -82,17 +103,49 @@ class ConfigLoader:
 
         if config_file:
             try:
-                with open(config_file, 'r', encoding='utf-8') as f:
-                    config = yaml.safe_load(f)
-                logging.info(f"Loaded config from: {config_file}")
+                config = cls.read_config_file(config_file)
+                logger.info(f"Loaded config from: {config_file}")
                 return config
             except Exception as e:
-                logging.warning(f"Error loading config from {config_file}: {e}")
+                logger.warning(f"Error loading config from {config_file}: {e}")
 
         # Return default config
-        logging.info("Using default configuration")
+        logger.info("Using default configuration")
         return cls.get_default_config()
 
+    @classmethod
+    def read_config_file(cls, config_file: str) -> Dict:
+        """
+        Parse a YAML config file, reusing the parse while the file is unchanged
+
+        Args:
+            config_file: Path to the YAML file
+
+        Returns:
+            Configuration dictionary (a private copy the caller may modify)
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+        """
+        mtime_ns = os.stat(config_file).st_mtime_ns
+        return copy.deepcopy(cls._parse_config_file(config_file, mtime_ns))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4)
+    def _parse_config_file(config_file: str, mtime_ns: int) -> Dict:
+        """
+        Parse a YAML config file (cached on path and modification time)
+
+        Args:
+            config_file: Path to the YAML file
+            mtime_ns: Modification time of the file, part of the cache key
+
+        Returns:
+            Parsed configuration dictionary
+        """
+        with open(config_file, 'r', encoding='utf-8') as f:
+            return yaml.load(f, Loader=_YamlLoader)
+
     @staticmethod
     def get_default_config() -> Dict:
         """Get default configuration"""
@@ -139,7 +192,7 @@ class ConfigLoader:
             Path to created config file
         """
         config_dir = os.path.join(cls.get_config_dir(), "arxiv-collector")
-        os.makedirs(config_dir, exist_ok=True)
+        cls.ensure_dir(config_dir)
 
         config_file = os.path.join(config_dir, "config.yaml")
 
@@ -152,6 +205,20 @@ class ConfigLoader:
 
         return config_file
 
+    @staticmethod
+    def ensure_dir(path: str):
+        """
+        Create a directory if it doesn't exist
+
+        Not memoized: a long-running daemon can outlive a directory it
+        created (e.g. removed by a tmp cleaner), and makedirs is cheap.
+
+        Args:
+            path: Directory to create (ignored if empty)
+        """
+        if path:
+            os.makedirs(path, exist_ok=True)
+
     @classmethod
     def get_output_paths(cls, config: Dict) -> Dict[str, str]:
         """
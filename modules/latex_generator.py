@@ -3,16 +3,153 @@ LaTeX Generator Module
 Generates LaTeX document from paper data
 """
 
+import functools
 import os
 from datetime import datetime
-from typing import List, Dict, Optional
-from jinja2 import Environment, FileSystemLoader, Template
+from typing import ClassVar, List, Dict, Optional
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, Template
 import logging
 
 
+# Single-pass translation table for LaTeX special characters
+_LATEX_TRANS = str.maketrans({
+    '\\': r'\textbackslash{}',
+    '&': r'\&',
+    '%': r'\%',
+    '$': r'\$',
+    '#': r'\#',
+    '_': r'\_',
+    '{': r'\{',
+    '}': r'\}',
+    '~': r'\textasciitilde{}',
+    '^': r'\^{}',
+})
+
+
+@functools.lru_cache(maxsize=8192)
+def _escape_latex_str(text: str) -> str:
+    """Escape a string, memoized since authors and categories repeat across papers"""
+    return text.translate(_LATEX_TRANS)
+
+
+def _latex_escape(text) -> str:
+    """
+    Escape special LaTeX characters
+
+    Args:
+        text: Text to escape
+
+    Returns:
+        Escaped text safe for LaTeX
+    """
+    return _escape_latex_str(str(text))
+
+
+def _bytecode_cache() -> Optional[FileSystemBytecodeCache]:
+    """
+    Get an on-disk cache for compiled templates, shared across runs
+
+    Returns:
+        Bytecode cache, or None if no safe cache directory is available
+    """
+    # Without a directory Jinja uses a private per-user temp directory and
+    # refuses one owned by someone else, so nobody can plant bytecode there
+    try:
+        return FileSystemBytecodeCache()
+    except (OSError, RuntimeError):
+        return None
+
+
+# Fallback template used when the template file cannot be loaded
+_BUILTIN_LATEX_SRC = r"""
+\documentclass[10pt,a4paper]{article}
+
+% Packages
+\usepackage[utf8]{inputenc}
+\usepackage[T1]{fontenc}
+\usepackage{geometry}
+\usepackage{hyperref}
+\usepackage{url}
+\usepackage{enumitem}
+\usepackage{titlesec}
+\usepackage{xcolor}
+\usepackage{longtable}
+
+% Page setup
+\geometry{margin=1in}
+
+% Hyperlink setup
+\hypersetup{
+    colorlinks=true,
+    linkcolor=blue,
+    filecolor=magenta,
+    urlcolor=cyan,
+    pdftitle={ {{ title }} },
+    pdfauthor={ArXiv Paper Collector}
+}
+
+% Custom section formatting
+\titleformat{\section}
+  {\normalfont\Large\bfseries\color{blue}}{\thesection}{1em}{}
+\titleformat{\subsection}
+  {\normalfont\large\bfseries\color{darkgray}}{\thesubsection}{1em}{}
+
+% Title info
+\title{ {{ title }} }
+\author{ {{ date }} }
+\date{}
+
+\begin{document}
+
+\maketitle
+
+\section*{Summary}
+\begin{itemize}
+    \item Total Papers: {{ total_papers }}
+    \item Groups: {{ total_groups }}
+    \item Generated: {{ date }}
+\end{itemize}
+
+\hrule
+\vspace{1em}
+
+{% for group_name, papers in groups.items() -%}
+{% if papers -%}
+\section{ {{ group_name|latex_escape|replace('_', ' ')|title }} }
+
+{% for paper in papers -%}
+\subsection*{ {{ paper.title|latex_escape }} }
+
+\textbf{Authors:} {{ paper._authors_latex }} \\[0.5em]
+
+\textbf{arXiv ID:} \href{ {{ paper.url }} }{ {{ paper.arxiv_id }} } \\[0.5em]
+
+\textbf{Published:} {{ paper.published|format_date }} \\[0.5em]
+
+\textbf{Categories:} {{ paper._categories_str }} \\[1em]
+
+\textbf{Abstract:}
+
+{{ paper.summary|latex_escape|truncate_latex(abstract_max_length) }}
+
+\vspace{1em}
+\hrule
+\vspace{1em}
+
+{% endfor -%}
+{% endif -%}
+{% endfor -%}
+
+\end{document}
+"""
+
+
 class LatexGenerator:
     """Generates LaTeX document from paper data"""
 
+    # Compiled built-in template, shared by all instances
+    _BUILTIN_TEMPLATE: ClassVar[Optional[Template]] = None
+
     def __init__(self, template_dir: str = "templates", template_name: str = "paper_report.tex"):
         """
         Initialize the LaTeX generator
@@ -25,6 +162,10 @@ class LatexGenerator:
         self.template_name = template_name
         self.logger = logging.getLogger(__name__)
 
+        # Loaded template, reused across generate_latex calls
+        self._compiled_template: Optional[Template] = None
+        self._compiled_template_name: Optional[str] = None
+
         # Setup Jinja2 environment with LaTeX-friendly settings
         self.env = None
         self._setup_environment()
@@ -32,16 +173,18 @@ class LatexGenerator:
     def _setup_environment(self):
         """Setup Jinja2 environment with LaTeX-specific settings"""
         try:
-            template_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), self.template_dir)
+            # Templates ship inside the package so installed copies find them too
+            template_path = os.path.join(os.path.dirname(__file__), self.template_dir)
             self.env = Environment(
                 loader=FileSystemLoader(template_path),
                 autoescape=False,
                 trim_blocks=True,
-                lstrip_blocks=True
+                lstrip_blocks=True,
+                bytecode_cache=_bytecode_cache()
             )
 
             # Add custom filters for LaTeX
-            self.env.filters['latex_escape'] = self._latex_escape
+            self.env.filters['latex_escape'] = _latex_escape
             self.env.filters['truncate_latex'] = self._truncate_latex
             self.env.filters['format_date'] = self._format_date
 
@@ -51,39 +194,26 @@ class LatexGenerator:
             self.logger.error(f"Error setting up Jinja2 environment: {e}")
             # Create a basic environment with default template
             self.env = Environment()
-            self.env.filters['latex_escape'] = self._latex_escape
+            self.env.filters['latex_escape'] = _latex_escape
             self.env.filters['truncate_latex'] = self._truncate_latex
             self.env.filters['format_date'] = self._format_date
 
-    @staticmethod
-    def _latex_escape(text: str) -> str:
+    def _load_template(self) -> Template:
         """
-        Escape special LaTeX characters
-
-        Args:
-            text: Text to escape
+        Load the configured template, reusing it until template_name changes
 
         Returns:
-            Escaped text safe for LaTeX
+            Jinja2 Template object (built-in template if loading fails)
         """
-        # Order matters: replace backslash first, then others
-        replacements = [
-            ('\\', r'\textbackslash{}'),
-            ('&', r'\&'),
-            ('%', r'\%'),
-            ('$', r'\$'),
-            ('#', r'\#'),
-            ('_', r'\_'),
-            ('{', r'\{'),
-            ('}', r'\}'),
-            ('~', r'\textasciitilde{}'),
-            ('^', r'\^{}'),
-        ]
-
-        for char, escaped in replacements:
-            text = text.replace(char, escaped)
-
-        return text
+        if self._compiled_template is None or self._compiled_template_name != self.template_name:
+            try:
+                self._compiled_template = self.env.get_template(self.template_name)
+            except Exception as e:
+                self.logger.warning(f"Could not load template: {e}. Using built-in template.")
+                self._compiled_template = self._get_builtin_template()
+            self._compiled_template_name = self.template_name
+
+        return self._compiled_template
 
     @staticmethod
     def _truncate_latex(text: str, max_length: int = 500, suffix: str = "...") -> str:
@@ -139,6 +269,9 @@ class LatexGenerator:
         """
         self.logger.info(f"Generating LaTeX document with {len(papers)} groups")
 
+        # One timestamp for the whole document, so title and date always agree
+        now_str = datetime.now().strftime("%Y-%m-%d")
+
         # Prepare data for template
         total_papers = sum(len(paper_list) for paper_list in papers.values())
 
@@ -147,10 +280,17 @@ class LatexGenerator:
         for group_name, paper_list in papers.items():
             sorted_groups[group_name] = paper_list[:max_papers]
 
+        # Format author and category lines once per paper, even if it appears in several groups
+        for paper_list in sorted_groups.values():
+            for paper in paper_list:
+                if "_authors_latex" not in paper:
+                    paper["_authors_latex"] = _latex_escape(', '.join(paper.get("authors", [])))
+                    paper["_categories_str"] = ', '.join(paper.get("categories", []))
+
         # Template context
         context = {
-            "title": title or f"ArXiv Papers Report - {datetime.now().strftime('%Y-%m-%d')}",
-            "date": datetime.now().strftime("%Y-%m-%d"),
+            "title": title or f"ArXiv Papers Report - {now_str}",
+            "date": now_str,
             "groups": sorted_groups,
             "total_papers": total_papers,
             "total_groups": len(papers),
@@ -158,115 +298,34 @@ class LatexGenerator:
         }
 
         # Load template
-        try:
-            template = self.env.get_template(self.template_name)
-        except Exception as e:
-            self.logger.warning(f"Could not load template: {e}. Using built-in template.")
-            template = self._get_builtin_template()
-
-        # Render LaTeX
-        latex_content = template.render(**context)
+        template = self._load_template()
 
         # Ensure output directory exists
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
 
-        # Write to file
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(latex_content)
+        # Render LaTeX straight to file without materializing the whole document
+        template.stream(**context).dump(output_path, encoding='utf-8')
 
         self.logger.info(f"LaTeX document generated: {output_path}")
 
         return output_path
 
-    def _get_builtin_template(self) -> Template:
+    @classmethod
+    def _get_builtin_template(cls) -> Template:
         """
-        Get built-in LaTeX template
+        Get built-in LaTeX template, compiled once per process
 
         Returns:
             Jinja2 Template object
         """
-        latex_template = r"""
-\documentclass[10pt,a4paper]{article}
-
-% Packages
-\usepackage[utf8]{inputenc}
-\usepackage[T1]{fontenc}
-\usepackage{geometry}
-\usepackage{hyperref}
-\usepackage{url}
-\usepackage{enumitem}
-\usepackage{titlesec}
-\usepackage{xcolor}
-\usepackage{longtable}
-
-% Page setup
-\geometry{margin=1in}
-
-% Hyperlink setup
-\hypersetup{
-    colorlinks=true,
-    linkcolor=blue,
-    filecolor=magenta,
-    urlcolor=cyan,
-    pdftitle={{{ title }}},
-    pdfauthor={ArXiv Paper Collector}
-}
-
-% Custom section formatting
-\titleformat{\section}
-  {\normalfont\Large\bfseries\color{blue}}{\thesection}{1em}{}
-\titleformat{\subsection}
-  {\normalfont\large\bfseries\color{darkgray}}{\thesubsection}{1em}{}
-
-% Title info
-\title{ {{ title }} }
-\author{ {{ date }} }
-\date{}
-
-\begin{document}
-
-\maketitle
-
-\section*{Summary}
-\begin{itemize}
-    \item Total Papers: {{ total_papers }}
-    \item Groups: {{ total_groups }}
-    \item Generated: {{ date }}
-\end{itemize}
-
-\hrule
-\vspace{1em}
-
-{% for group_name, papers in groups.items() -%}
-{% if papers -%}
-\section{{{ group_name|latex_escape|replace('_', ' ')|title }}}
-
-{% for paper in papers -%}
-\subsection*{{{ paper.title|latex_escape }}}
-
-\textbf{Authors:} {{ paper.authors|join(', ')|latex_escape }} \\[0.5em]
-
-\textbf{arXiv ID:} \href{{{ paper.url }}}{{{ paper.arxiv_id }}} \\[0.5em]
-
-\textbf{Published:} {{ paper.published|format_date }} \\[0.5em]
-
-\textbf{Categories:} {{ paper.categories|join(', ') }} \\[1em]
-
-\textbf{Abstract:}
-
-{{ paper.summary|latex_escape|truncate_latex(abstract_max_length) }}
-
-\vspace{1em}
-\hrule
-\vspace{1em}
-
-{% endfor -%}
-{% endif -%}
-{% endfor -%}
-
-\end{document}
-"""
-        return Template(latex_template, autoescape=False)
+        if cls._BUILTIN_TEMPLATE is None:
+            env = Environment(autoescape=False, trim_blocks=True, lstrip_blocks=True)
+            env.filters['latex_escape'] = _latex_escape
+            env.filters['truncate_latex'] = cls._truncate_latex
+            env.filters['format_date'] = cls._format_date
+            cls._BUILTIN_TEMPLATE = env.from_string(_BUILTIN_LATEX_SRC)
+
+        return cls._BUILTIN_TEMPLATE
 
     def generate_simple_report(
         self,
@@ -3,13 +3,15 @@ Notification Module
 Supports email and system notifications for completed collections
 """
 
+import json
 import os
+import shutil
 import smtplib
 import subprocess
 import platform
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from typing import Optional, List
+from typing import Dict, Optional, List
 import logging
 
 
@@ -25,6 +27,7 @@ class NotificationManager:
         """
         self.config = config or {}
         self.logger = logging.getLogger(__name__)
+        self._cmd_cache: Dict[str, bool] = {}
 
     def send_notification(
         self,
@@ -78,11 +81,13 @@ class NotificationManager:
             system = platform.system()
 
             if system == "Darwin":  # macOS
-                # Use osascript for macOS notifications
-                cmd = [
-                    "osascript", "-e",
-                    f'display notification "{message}" with title "{title}" sound name "default"'
-                ]
+                # Use osascript for macOS notifications; JSON string literals are
+                # valid AppleScript literals, so quotes and backslashes survive
+                script = (
+                    f'display notification {json.dumps(message, ensure_ascii=False)} '
+                    f'with title {json.dumps(title, ensure_ascii=False)} sound name "default"'
+                )
+                cmd = ["osascript", "-e", script]
                 subprocess.run(cmd, check=True, capture_output=True)
                 return True
 
@@ -166,18 +171,12 @@ class NotificationManager:
             self.logger.error(f"Email notification failed: {e}")
             return False
 
-    @staticmethod
-    def _command_exists(command: str) -> bool:
+    def _command_exists(self, command: str) -> bool:
         """Check if a command exists on the system"""
-        try:
-            subprocess.run(
-                ["which", command],
-                check=True,
-                capture_output=True
-            )
-            return True
-        except subprocess.CalledProcessError:
-            return False
+        exists = self._cmd_cache.get(command)
+        if exists is None:
+            exists = self._cmd_cache[command] = shutil.which(command) is not None
+        return exists
 
     @staticmethod
     def get_email_config_template() -> dict:
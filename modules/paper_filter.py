@@ -4,9 +4,16 @@ Filters papers based on keywords and categories
 """
 
 import re
-from typing import List, Dict, Set
+from collections import Counter
+from itertools import compress
+from typing import List, Dict, Optional, Set
 import logging
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 
 class PaperFilter:
     """Filters papers based on keywords and categories"""
@@ -24,6 +31,62 @@ class PaperFilter:
         self.keywords = keywords
         self.logger = logging.getLogger(__name__)
 
+        # Keywords are matched case-insensitively, so lowercase them once
+        self._keywords_lower: Dict[str, List[str]] = {
+            group_name: [keyword.lower() for keyword in group_keywords]
+            for group_name, group_keywords in keywords.items()
+        }
+
+        # Flattened keywords for relevance scoring
+        self._all_keywords_lower: List[str] = [
+            keyword for group_keywords in self._keywords_lower.values() for keyword in group_keywords
+        ]
+        self._unique_keyword_count = len(set(self._all_keywords_lower))
+
+        # Multi-keyword automaton (optional, requires pyahocorasick),
+        # otherwise one precompiled alternation pattern per group
+        self._automaton = self._build_automaton()
+        self._group_patterns = self._build_group_patterns() if self._automaton is None else {}
+
+    def _build_automaton(self):
+        """
+        Build an Aho-Corasick automaton over all keywords of all groups
+
+        Returns:
+            Automaton mapping each lowercased keyword to its groups,
+            or None if pyahocorasick is not installed or there are no keywords
+        """
+        if ahocorasick is None:
+            return None
+
+        keyword_groups: Dict[str, List[str]] = {}
+        for group_name, group_keywords in self._keywords_lower.items():
+            for keyword in group_keywords:
+                keyword_groups.setdefault(keyword, []).append(group_name)
+
+        if not keyword_groups:
+            return None
+
+        automaton = ahocorasick.Automaton()
+        for keyword, groups in keyword_groups.items():
+            automaton.add_word(keyword, tuple(groups))
+        automaton.make_automaton()
+
+        return automaton
+
+    def _build_group_patterns(self) -> Dict[str, Optional[re.Pattern]]:
+        """
+        Compile one regex per group matching any of its lowercased keywords
+
+        Returns:
+            Dictionary mapping group names to patterns (None for empty groups)
+        """
+        return {
+            group_name: re.compile("|".join(map(re.escape, group_keywords)))
+            if group_keywords else None
+            for group_name, group_keywords in self._keywords_lower.items()
+        }
+
     def filter_papers(self, papers: List[Dict], match_any: bool = False) -> Dict[str, List[Dict]]:
         """
         Filter papers into groups based on keyword matching
@@ -38,24 +101,31 @@ class PaperFilter:
         """
         self.logger.info(f"Filtering {len(papers)} papers")
 
-        grouped_papers = {}
-        all_matched_papers = set()
-
-        for group_name, group_keywords in self.keywords.items():
-            matched_papers = []
-            for paper in papers:
-                if self._matches_keywords(paper, group_keywords):
-                    matched_papers.append(paper)
-                    all_matched_papers.add(id(paper))
-
-            grouped_papers[group_name] = matched_papers
+        grouped_papers = {group_name: [] for group_name in self.keywords}
+        # Positional flags instead of a set of id(paper) lookups
+        unmatched = [True] * len(papers)
+
+        # Paper-major: each paper's text is normalized and scanned exactly once
+        for index, paper in enumerate(papers):
+            text = self._search_text(paper)
+            if self._automaton is not None:
+                # A single automaton scan finds all matching groups
+                matched_groups = self._match_groups(text)
+            else:
+                matched_groups = [
+                    group_name for group_name in self.keywords
+                    if self._matches_keywords(text, group_name)
+                ]
+
+            for group_name in matched_groups:
+                grouped_papers[group_name].append(paper)
+                unmatched[index] = False
+
+        for group_name, matched_papers in grouped_papers.items():
             self.logger.info(f"Group '{group_name}': {len(matched_papers)} papers matched")
 
         # Get papers that didn't match any group
-        unmatched_papers = [
-            paper for paper in papers
-            if id(paper) not in all_matched_papers
-        ]
+        unmatched_papers = list(compress(papers, unmatched))
 
         if unmatched_papers:
             grouped_papers["uncategorized"] = unmatched_papers
@@ -63,50 +133,57 @@ class PaperFilter:
 
         return grouped_papers
 
-    def _matches_keywords(self, paper: Dict, keywords: List[str]) -> bool:
+    @staticmethod
+    def _search_text(paper: Dict) -> str:
         """
-        Check if a paper matches any of the given keywords
+        Get the lowercased title and summary used for keyword matching
 
         Args:
             paper: Paper dictionary
-            keywords: List of keywords to check
 
         Returns:
-            True if paper matches any keyword
+            Lowercased search text, precomputed by ArxivFetcher when available
         """
-        # Combine title and summary for searching
-        text_to_search = (
-            paper.get("title", "").lower() + " " +
-            paper.get("summary", "").lower()
-        )
+        text = paper.get("_search")
+        if text is None:
+            # Store it so later steps (e.g. relevance scoring) can reuse it
+            text = (paper.get("title", "") + " " + paper.get("summary", "")).lower()
+            paper["_search"] = text
+        return text
+
+    def _match_groups(self, text: str) -> Set[str]:
+        """
+        Find all keyword groups matching a paper using the automaton
+
+        Args:
+            text: Lowercased search text of the paper
 
-        for keyword in keywords:
-            if self._keyword_matches(keyword, text_to_search):
-                return True
+        Returns:
+            Set of matching group names
+        """
+        matched_groups: Set[str] = set()
+        for _, groups in self._automaton.iter(text):
+            matched_groups.update(groups)
 
-        return False
+        return matched_groups
 
-    def _keyword_matches(self, keyword: str, text: str) -> bool:
+    def _matches_keywords(self, text: str, group_name: str) -> bool:
         """
-        Check if a keyword matches in the text
+        Check if a paper matches any keyword of a group
 
         Args:
-            keyword: Keyword to search for
-            text: Text to search in
+            text: Lowercased search text of the paper
+            group_name: Keyword group to check
 
         Returns:
-            True if keyword is found in text
+            True if paper matches any keyword
         """
-        # Exact phrase match
-        if keyword.lower() in text:
-            return True
-
-        # Word boundary match
-        pattern = r'\b' + re.escape(keyword.lower()) + r'\b'
-        if re.search(pattern, text):
-            return True
+        pattern = self._group_patterns.get(group_name)
+        if pattern is None:
+            return False
 
-        return False
+        # Single C-level scan for all keywords of the group
+        return pattern.search(text) is not None
 
     def filter_by_relevance(self, papers: List[Dict], min_relevance: float = 0.3) -> List[Dict]:
         """
@@ -144,24 +221,15 @@ class PaperFilter:
         Returns:
             Relevance score between 0 and 1
         """
-        all_keywords = []
-        for keyword_list in self.keywords.values():
-            all_keywords.extend(keyword_list)
-
-        # Count keyword matches
-        text = (paper.get("title", "") + " " + paper.get("summary", "")).lower()
-        matches = 0
-
-        for keyword in all_keywords:
-            if keyword.lower() in text:
-                matches += 1
-
         # Calculate relevance as ratio of matched keywords to total unique keywords
-        unique_keywords = len(set(all_keywords))
-        if unique_keywords == 0:
+        if self._unique_keyword_count == 0:
             return 0.0
 
-        return min(matches / unique_keywords, 1.0)
+        # Count keyword matches
+        text = self._search_text(paper)
+        matches = sum(1 for keyword in self._all_keywords_lower if keyword in text)
+
+        return min(matches / self._unique_keyword_count, 1.0)
 
     def get_paper_summary(self, papers: List[Dict]) -> Dict:
         """
@@ -180,21 +248,22 @@ class PaperFilter:
                 "date_range": None
             }
 
-        # Count by category
-        category_counts = {}
+        # Count by category and track the date range in a single pass
+        category_counts = Counter()
+        earliest = latest = None
         for paper in papers:
-            for category in paper.get("categories", []):
-                category_counts[category] = category_counts.get(category, 0) + 1
-
-        # Get date range
-        dates = [paper["published"] for paper in papers]
-        date_range = {
-            "earliest": min(dates),
-            "latest": max(dates)
-        }
+            category_counts.update(paper.get("categories", ()))
+            published = paper["published"]
+            if earliest is None or published < earliest:
+                earliest = published
+            if latest is None or published > latest:
+                latest = published
 
         return {
             "total": len(papers),
-            "categories": category_counts,
-            "date_range": date_range
+            "categories": dict(category_counts),
+            "date_range": {
+                "earliest": earliest,
+                "latest": latest
+            }
         }
@@ -4,22 +4,55 @@ Compiles LaTeX documents to PDF using pdflatex
 """
 
 import os
+import re
 import subprocess
+import sys
 import tempfile
 import shutil
-from typing import Optional, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import ClassVar, Dict, Optional, List
 import logging
 from pathlib import Path
 
 
+# Engine flags that skip writing the PDF on passes that only resolve references
+DRAFT_MODE_FLAGS = {
+    "pdflatex": "-draftmode",
+    "lualatex": "--draftmode",
+    "xelatex": "-no-pdf",
+}
+
+# RAM-backed filesystem used for intermediate build files where available
+SCRATCH_ROOT = "/dev/shm"
+
+# Messages LaTeX and its packages print when another pass is needed
+RERUN_PATTERN = re.compile(r"Rerun to get|Please rerun|Rerun LaTeX")
+
+
+def _scratch_root() -> Optional[str]:
+    """
+    Get the parent directory for temporary build directories
+
+    Returns:
+        RAM-backed directory on Linux if usable, None for the system default
+    """
+    if sys.platform.startswith("linux") and os.access(SCRATCH_ROOT, os.W_OK | os.X_OK):
+        return SCRATCH_ROOT
+    return None
+
+
 class PdfCompiler:
     """Compiles LaTeX documents to PDF"""
 
+    # Engine availability per engine name, shared by all compiler instances
+    _ENGINE_CHECKED: ClassVar[Dict[str, bool]] = {}
+
     def __init__(
         self,
         engine: str = "pdflatex",
         max_compile_time: int = 60,
-        attempts: int = 2
+        attempts: int = 2,
+        draft_intermediate: bool = True
     ):
         """
         Initialize the PDF compiler
@@ -28,10 +61,12 @@ class PdfCompiler:
             engine: LaTeX engine to use (pdflatex, xelatex, lualatex)
             max_compile_time: Maximum compilation time in seconds
             attempts: Number of compilation attempts
+            draft_intermediate: Run all but the final pass in draft mode (no PDF output)
         """
         self.engine = engine
         self.max_compile_time = max_compile_time
         self.attempts = attempts
+        self.draft_intermediate = draft_intermediate
         self.logger = logging.getLogger(__name__)
 
     def compile(
@@ -68,48 +103,98 @@ class PdfCompiler:
             self.logger.error(f"LaTeX engine '{self.engine}' not found. Please install LaTeX (e.g., TeX Live or MiKTeX)")
             return None
 
+        if clean_aux:
+            # Auxiliary files only ever live in a scratch directory removed afterwards
+            with tempfile.TemporaryDirectory(prefix="arxiv_latex_", dir=_scratch_root()) as build_dir:
+                pdf_path = self._build_pdf(latex_path, Path(build_dir), Path(output_dir))
+                if pdf_path is None:
+                    # Keep the full engine log, the scratch directory is about to go away
+                    self._preserve_log(latex_path, Path(build_dir), Path(output_dir))
+                return pdf_path
+
+        # Keep auxiliary files next to the LaTeX source
+        return self._build_pdf(latex_path, latex_path.parent.resolve(), Path(output_dir))
+
+    def _build_pdf(self, latex_path: Path, build_dir: Path, output_dir: Path) -> Optional[str]:
+        """
+        Run all LaTeX passes and move the resulting PDF into place
+
+        Args:
+            latex_path: Path to the LaTeX file
+            build_dir: Directory receiving the PDF and auxiliary files
+            output_dir: Directory for the final PDF
+
+        Returns:
+            Path to the generated PDF, or None if compilation failed
+        """
         # Run LaTeX compilation (may need multiple passes for references)
-        for attempt in range(self.attempts):
-            success = self._run_compilation(latex_path, output_dir, attempt + 1)
-            if not success:
-                self.logger.error(f"Compilation failed on attempt {attempt + 1}")
+        attempt = 1
+        while attempt <= self.attempts:
+            final = attempt == self.attempts
+            draft = self.draft_intermediate and not final
+            output = self._run_compilation(latex_path, str(build_dir), attempt, draft=draft)
+            if output is None:
+                self.logger.error(f"Compilation failed on attempt {attempt}")
                 return None
 
+            if final or self._needs_rerun(output):
+                attempt += 1
+            elif draft:
+                # References are settled, only the PDF-producing pass is left
+                attempt = self.attempts
+            else:
+                break
+
         # Find the generated PDF
-        pdf_path = latex_path.with_suffix('.pdf')
-        if output_dir != latex_path.parent:
-            target_pdf = Path(output_dir) / latex_path.with_suffix('.pdf').name
+        pdf_path = build_dir / latex_path.with_suffix('.pdf').name
+        if not pdf_path.exists():
+            self.logger.error("PDF file was not generated")
+            return None
+
+        target_pdf = output_dir / pdf_path.name
+        if target_pdf.resolve() != pdf_path.resolve():
             shutil.move(str(pdf_path), str(target_pdf))
-            pdf_path = target_pdf
 
-        if pdf_path.exists():
-            self.logger.info(f"PDF generated successfully: {pdf_path}")
+        self.logger.info(f"PDF generated successfully: {target_pdf}")
+        return str(target_pdf)
 
-            # Clean auxiliary files if requested
-            if clean_aux:
-                self._clean_aux_files(latex_path.with_suffix(''))
+    def _preserve_log(self, latex_path: Path, build_dir: Path, output_dir: Path):
+        """
+        Copy the LaTeX log of a failed build into the output directory
 
-            return str(pdf_path)
-        else:
-            self.logger.error("PDF file was not generated")
-            return None
+        Args:
+            latex_path: Path to the LaTeX file
+            build_dir: Scratch directory holding the build files
+            output_dir: Directory to copy the log to
+        """
+        log_path = build_dir / latex_path.with_suffix('.log').name
+        if not log_path.exists():
+            return
+
+        try:
+            target_log = shutil.copy2(str(log_path), str(output_dir / log_path.name))
+            self.logger.error(f"Full LaTeX log saved to: {target_log}")
+        except OSError as e:
+            self.logger.warning(f"Could not save LaTeX log {log_path}: {e}")
 
     def _run_compilation(
         self,
         latex_path: Path,
         output_dir: str,
-        attempt: int
-    ) -> bool:
+        attempt: int,
+        draft: bool = False
+    ) -> Optional[str]:
         """
         Run a single LaTeX compilation attempt
 
         Args:
             latex_path: Path to the LaTeX file
-            output_dir: Output directory
+            output_dir: Directory for the PDF and auxiliary files
             attempt: Attempt number
+            draft: Skip PDF generation (only update auxiliary files)
 
         Returns:
-            True if successful, False otherwise
+            Engine output if successful, None otherwise
         """
         try:
             # Build command - compile in LaTeX file's directory
@@ -117,9 +202,15 @@ class PdfCompiler:
                 self.engine,
                 "-interaction=nonstopmode",
                 "-halt-on-error",
-                latex_path.name  # Just the filename, not full path
+                f"-output-directory={output_dir}"
             ]
 
+            draft_flag = DRAFT_MODE_FLAGS.get(Path(self.engine).name)
+            if draft and draft_flag:
+                cmd.append(draft_flag)
+
+            cmd.append(latex_path.name)  # Just the filename, not full path
+
             self.logger.debug(f"Running compilation attempt {attempt}: {' '.join(cmd)}")
 
             # Use the directory containing the LaTeX file as working directory
@@ -137,23 +228,37 @@ class PdfCompiler:
             if result.returncode != 0:
                 self.logger.error(f"Compilation error (attempt {attempt}):")
                 self._log_compilation_errors(result.stdout)
-                return False
+                return None
 
             # Check for fatal errors
             if "Fatal error" in result.stdout or "! Emergency stop" in result.stdout:
                 self.logger.error(f"Fatal error in LaTeX compilation (attempt {attempt})")
                 self._log_compilation_errors(result.stdout)
-                return False
+                return None
 
             self.logger.debug(f"Compilation attempt {attempt} completed")
-            return True
+            return result.stdout
 
         except subprocess.TimeoutExpired:
             self.logger.error(f"Compilation timed out after {self.max_compile_time} seconds")
-            return False
+            return None
         except Exception as e:
             self.logger.error(f"Compilation error: {e}")
-            return False
+            return None
+
+    @staticmethod
+    def _needs_rerun(output: str) -> bool:
+        """
+        Check whether a pass asked for another LaTeX run
+
+        Args:
+            output: Engine output of the pass
+
+        Returns:
+            True if references or outlines are not settled yet
+        """
+        # TeX wraps console output at a fixed width, so rejoin lines first
+        return RERUN_PATTERN.search(output.replace("\n", "")) is not None
 
     def _check_engine(self) -> bool:
         """
@@ -162,15 +267,19 @@ class PdfCompiler:
         Returns:
             True if engine is found, False otherwise
         """
-        try:
-            result = subprocess.run(
-                [self.engine, "--version"],
-                capture_output=True,
-                timeout=5
-            )
-            return result.returncode == 0
-        except (FileNotFoundError, subprocess.TimeoutExpired):
-            return False
+        available = PdfCompiler._ENGINE_CHECKED.get(self.engine)
+        if available is None:
+            try:
+                result = subprocess.run(
+                    [self.engine, "--version"],
+                    capture_output=True,
+                    timeout=5
+                )
+                available = result.returncode == 0
+            except (FileNotFoundError, subprocess.TimeoutExpired):
+                available = False
+            PdfCompiler._ENGINE_CHECKED[self.engine] = available
+        return available
 
     def _log_compilation_errors(self, output: str):
         """
@@ -195,48 +304,36 @@ class PdfCompiler:
             for line in error_lines[-10:]:
                 self.logger.error(f"  {line}")
 
-    def _clean_aux_files(self, base_path: Path):
-        """
-        Clean auxiliary LaTeX files
-
-        Args:
-            base_path: Base path of the LaTeX file (without extension)
-        """
-        aux_extensions = [
-            '.aux', '.log', '.out', '.toc', '.lof', '.lot',
-            '.fls', '.fdb_latexmk', '.synctex.gz', '.bbl', '.blg'
-        ]
-
-        for ext in aux_extensions:
-            aux_file = base_path.with_suffix(ext)
-            if aux_file.exists():
-                try:
-                    aux_file.unlink()
-                    self.logger.debug(f"Cleaned auxiliary file: {aux_file}")
-                except Exception as e:
-                    self.logger.warning(f"Could not clean {aux_file}: {e}")
-
     def batch_compile(
         self,
         latex_files: List[str],
-        output_dir: Optional[str] = None
+        output_dir: Optional[str] = None,
+        max_workers: Optional[int] = None
     ) -> List[str]:
         """
-        Compile multiple LaTeX files
+        Compile multiple LaTeX files in parallel
 
         Args:
             latex_files: List of LaTeX file paths
             output_dir: Common output directory
+            max_workers: Maximum number of concurrent compilations (CPU count if None)
 
         Returns:
             List of successfully generated PDF paths
         """
-        successful = []
-
-        for latex_file in latex_files:
-            pdf_path = self.compile(latex_file, output_dir)
-            if pdf_path:
-                successful.append(pdf_path)
+        if not latex_files:
+            return []
+
+        # Each compilation runs the engine as a separate process, so threads
+        # are enough to keep several of them busy at once
+        max_workers = max(1, min(max_workers or os.cpu_count() or 1, len(latex_files)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(
+                lambda latex_file: self.compile(latex_file, output_dir),
+                latex_files
+            ))
+
+        successful = [pdf_path for pdf_path in results if pdf_path]
 
         self.logger.info(f"Batch compilation: {len(successful)}/{len(latex_files)} successful")
 
@@ -3,13 +3,186 @@ Scheduler Module
 Handles scheduling of paper collection tasks
 """
 
-import schedule
-import time
+import functools
+import heapq
+import itertools
+import signal
 import threading
-from datetime import datetime
-from typing import Callable, Optional
+import time
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Tuple
 import logging
 
+if TYPE_CHECKING:
+    import asyncio
+    from concurrent.futures import Future, ThreadPoolExecutor
+
+
+logger = logging.getLogger(__name__)
+
+# Upper bound for a single wait, so clock changes are picked up eventually
+MAX_IDLE_SECONDS = 3600
+
+# Manual runs that may execute at the same time
+RUN_NOW_WORKERS = 2
+
+# Retry delays for a failing job double from the first delay up to the maximum
+RETRY_BASE_SECONDS = 60
+MAX_RETRY_SECONDS = 300
+
+
+@functools.lru_cache(maxsize=32)
+def _cron_entry(hour: int, minute: int, script_path: str) -> str:
+    """Build a crontab entry (memoized, the result only depends on the arguments)"""
+    return f"{minute} {hour} * * * cd /path/to/arxiv-paper-collector && /usr/bin/python3 {script_path} >> output/cron.log 2>&1"
+
+
+@functools.lru_cache(maxsize=32)
+def _systemd_service_content(project_path: str) -> str:
+    """Build systemd service file content for a project path (memoized)"""
+    return f"""[Unit]
+Description=ArXiv Paper Collector Service
+After=network.target
+
+[Service]
+Type=simple
+User=your_username
+WorkingDirectory={project_path}
+ExecStart=/usr/bin/python3 {project_path}/main.py --daemon
+Restart=always
+RestartSec=10
+
+[Install]
+WantedBy=multi-user.target
+"""
+
+
+class _Job:
+    """A scheduled task, either daily at a fixed time or at a fixed interval"""
+
+    __slots__ = ("task", "interval", "hour", "minute")
+
+    def __init__(
+        self,
+        task: Callable,
+        interval: Optional[float] = None,
+        hour: int = 0,
+        minute: int = 0
+    ):
+        self.task = task
+        self.interval = interval
+        self.hour = hour
+        self.minute = minute
+
+    def next_run_after(self, now: float) -> float:
+        """
+        Compute the next firing time
+
+        Args:
+            now: Reference time as epoch seconds
+
+        Returns:
+            Next firing time as epoch seconds, strictly after now for daily jobs
+        """
+        if self.interval is not None:
+            return now + self.interval
+
+        # Daily jobs follow local wall-clock time
+        current = datetime.fromtimestamp(now)
+        target = current.replace(hour=self.hour, minute=self.minute, second=0, microsecond=0)
+        if target <= current:
+            target += timedelta(days=1)
+        return target.timestamp()
+
+
+class _HeapScheduler:
+    """Min-heap of jobs keyed by their next firing time"""
+
+    def __init__(self):
+        self._heap: List[Tuple[float, int, _Job]] = []
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+
+    def add(self, job: _Job):
+        """
+        Schedule a job for its next firing time
+
+        Args:
+            job: Job to add
+        """
+        with self._lock:
+            heapq.heappush(self._heap, (job.next_run_after(time.time()), next(self._counter), job))
+
+    def run_pending(self):
+        """
+        Run all jobs that are due, rescheduling each after it completes
+
+        A job that raises is left due and the error propagates, so the
+        caller decides when to retry it.
+        """
+        while True:
+            with self._lock:
+                if not self._heap or self._heap[0][0] > time.time():
+                    return
+                entry = heapq.heappop(self._heap)
+
+            job = entry[2]
+            try:
+                job.task()
+            except Exception:
+                with self._lock:
+                    heapq.heappush(self._heap, entry)
+                raise
+
+            with self._lock:
+                heapq.heappush(self._heap, (job.next_run_after(time.time()), next(self._counter), job))
+
+    def idle_seconds(self) -> Optional[float]:
+        """
+        Get the time until the next job is due
+
+        Returns:
+            Seconds until the next job (negative if overdue), or None without jobs
+        """
+        with self._lock:
+            if not self._heap:
+                return None
+            return self._heap[0][0] - time.time()
+
+    def next_run(self) -> Optional[datetime]:
+        """
+        Get the next firing time
+
+        Returns:
+            Next run time as datetime, or None without jobs
+        """
+        with self._lock:
+            if not self._heap:
+                return None
+            return datetime.fromtimestamp(self._heap[0][0])
+
+    def reschedule_daily(self, hour: int, minute: int):
+        """
+        Move all daily jobs to a new time of day
+
+        Args:
+            hour: New hour (0-23)
+            minute: New minute (0-59)
+        """
+        now = time.time()
+        with self._lock:
+            for index, (_, seq, job) in enumerate(self._heap):
+                if job.interval is None:
+                    job.hour = hour
+                    job.minute = minute
+                    self._heap[index] = (job.next_run_after(now), seq, job)
+            heapq.heapify(self._heap)
+
+    def clear(self):
+        """Remove all jobs"""
+        with self._lock:
+            self._heap.clear()
+
 
 class PaperScheduler:
     """Schedules automated paper collection tasks"""
@@ -24,9 +197,26 @@ class PaperScheduler:
         """
         self.hour = hour
         self.minute = minute
-        self.logger = logging.getLogger(__name__)
+        self._time_str = f"{hour:02d}:{minute:02d}"
         self.running = False
         self.thread: Optional[threading.Thread] = None
+        self._jobs = _HeapScheduler()
+        # Set to cut the scheduler's wait short (new job added or stopping)
+        self._wake = threading.Event()
+        # Consecutive loop iterations that ended with a job error
+        self._failed_iters = 0
+        # Next run time and the moment it goes stale (when that job fires)
+        self._cached_next_run: Optional[datetime] = None
+        self._cache_valid_until: Optional[datetime] = None
+        # Pool for run_now, created on first use
+        self._executor: Optional["ThreadPoolExecutor"] = None
+        # Event loop state while running through start_async
+        self._task: Optional["asyncio.Task"] = None
+        self._loop: Optional["asyncio.AbstractEventLoop"] = None
+        self._async_wake: Optional["asyncio.Event"] = None
+        # Handler replaced by start_signal_mode, restored on stop
+        self._signal_mode = False
+        self._prev_alarm_handler: Any = None
 
     def schedule_daily(self, task: Callable):
         """
@@ -35,8 +225,26 @@ class PaperScheduler:
         Args:
             task: Callable function to execute
         """
-        schedule.every().day.at(f"{self.hour:02d}:{self.minute:02d}").do(task)
-        self.logger.info(f"Scheduled task to run daily at {self.hour:02d}:{self.minute:02d}")
+        self._jobs.add(_Job(task, hour=self.hour, minute=self.minute))
+        logger.info("Scheduled task to run daily at %s", self._time_str)
+        self._cache_valid_until = None
+        self._notify()
+
+    def reschedule(self, hour: int, minute: int):
+        """
+        Change the daily run time, keeping already scheduled daily tasks
+
+        Args:
+            hour: Hour to run the task (0-23)
+            minute: Minute to run the task (0-59)
+        """
+        self.hour = hour
+        self.minute = minute
+        self._time_str = f"{hour:02d}:{minute:02d}"
+        self._jobs.reschedule_daily(hour, minute)
+        logger.info("Rescheduled daily tasks to %s", self._time_str)
+        self._cache_valid_until = None
+        self._notify()
 
     def schedule_interval(self, task: Callable, interval_minutes: int):
         """
@@ -46,49 +254,242 @@ class PaperScheduler:
             task: Callable function to execute
             interval_minutes: Interval in minutes
         """
-        schedule.every(interval_minutes).minutes.do(task)
-        self.logger.info(f"Scheduled task to run every {interval_minutes} minutes")
+        self._jobs.add(_Job(task, interval=interval_minutes * 60))
+        logger.info("Scheduled task to run every %d minutes", interval_minutes)
+        self._cache_valid_until = None
+        self._notify()
 
     def start(self):
         """Start the scheduler in a background thread"""
         if self.running:
-            self.logger.warning("Scheduler is already running")
+            logger.warning("Scheduler is already running")
             return
 
         self.running = True
         self.thread = threading.Thread(target=self._run_scheduler, daemon=True)
         self.thread.start()
-        self.logger.info("Scheduler started")
+        logger.info("Scheduler started")
+
+    def start_async(self, loop: Optional["asyncio.AbstractEventLoop"] = None) -> Optional["asyncio.Task"]:
+        """
+        Start the scheduler as a task on an asyncio event loop, without a dedicated thread
+
+        Args:
+            loop: Event loop to run on (the running event loop if None)
+
+        Returns:
+            The scheduler task, or None if already running or no loop is available
+        """
+        import asyncio
+
+        if self.running:
+            logger.warning("Scheduler is already running")
+            return None
+
+        if loop is None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                logger.error("start_async needs a running event loop or an explicit loop")
+                return None
+
+        self.running = True
+        self._task = loop.create_task(self._async_run())
+        logger.info("Scheduler started on event loop")
+        return self._task
+
+    def start_signal_mode(self) -> bool:
+        """
+        Drive the scheduled jobs from SIGALRM instead of a thread or event loop
+
+        The kernel timer fires when the next job is due, and jobs run in the
+        main thread from the signal handler. POSIX only, and must be called
+        from the main thread; the main thread is then free to block (e.g. in
+        signal.pause()).
+
+        Returns:
+            True if the timer was armed, False otherwise
+        """
+        if not hasattr(signal, "setitimer"):
+            logger.error("Signal mode requires a POSIX system with setitimer")
+            return False
+        if threading.current_thread() is not threading.main_thread():
+            logger.error("Signal mode can only be started from the main thread")
+            return False
+        if self.running:
+            logger.warning("Scheduler is already running")
+            return False
+
+        self.running = True
+        self._signal_mode = True
+        self._prev_alarm_handler = signal.signal(signal.SIGALRM, self._on_alarm)
+        self._arm_timer()
+        logger.info("Scheduler started in signal mode")
+        return True
+
+    def _on_alarm(self, signum, frame):
+        """Run due jobs when the timer fires, then arm it for the next one"""
+        if self._has_due_jobs():
+            self._run_pending()
+        if self._signal_mode:
+            self._arm_timer()
+
+    def _arm_timer(self):
+        """Set the one-shot interval timer to the next job's firing time"""
+        # Re-armed after each run, so a long job can never be re-entered
+        signal.setitimer(signal.ITIMER_REAL, self._wait_timeout())
 
     def stop(self):
         """Stop the scheduler"""
         self.running = False
-        schedule.clear()
+        self._notify()
+        if self._signal_mode:
+            self._signal_mode = False
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            # Handlers can only be installed from the main thread
+            if threading.current_thread() is threading.main_thread():
+                signal.signal(signal.SIGALRM, self._prev_alarm_handler)
+        if self._task is not None:
+            # Task methods are not thread-safe, so cancel from within the loop
+            self._task.get_loop().call_soon_threadsafe(self._task.cancel)
+            self._task = None
+        self._jobs.clear()
+        self._cache_valid_until = None
+        if self._executor is not None:
+            try:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+            except TypeError:
+                # cancel_futures needs Python 3.9+
+                self._executor.shutdown(wait=False)
+            self._executor = None
         if self.thread:
-            self.thread.join(timeout=5)
-        self.logger.info("Scheduler stopped")
+            # The wake event interrupts the wait, so the thread exits as soon as
+            # any running job returns; a task calling stop() must not join itself
+            if self.thread is not threading.current_thread():
+                self.thread.join()
+            self.thread = None
+        logger.info("Scheduler stopped")
+
+    def _notify(self):
+        """Wake up the scheduler loop, threaded, asyncio or signal driven, to re-check its jobs"""
+        self._wake.set()
+        if self._signal_mode:
+            self._arm_timer()
+        loop, async_wake = self._loop, self._async_wake
+        if loop is not None and async_wake is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(async_wake.set)
 
     def _run_scheduler(self):
         """Run the scheduler loop"""
         while self.running:
-            try:
-                schedule.run_pending()
-                time.sleep(60)  # Check every minute
-            except Exception as e:
-                self.logger.error(f"Error in scheduler loop: {e}")
+            # Clear before checking jobs so a wake-up that arrives meanwhile is not lost
+            self._wake.clear()
+            if self._has_due_jobs():
+                self._run_pending()
+            self._wake.wait(timeout=self._wait_timeout())
 
-    def run_now(self, task: Callable):
+    async def _async_run(self):
+        """Run the scheduler loop as an asyncio task"""
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        self._loop = loop
+        self._async_wake = asyncio.Event()
+        try:
+            while self.running:
+                self._async_wake.clear()
+                if self._has_due_jobs():
+                    # Jobs are blocking, so keep them off the event loop
+                    await loop.run_in_executor(None, self._run_pending)
+                try:
+                    await asyncio.wait_for(self._async_wake.wait(), timeout=self._wait_timeout())
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            self._loop = None
+            self._async_wake = None
+
+    def _has_due_jobs(self) -> bool:
         """
-        Run a task immediately
+        Check whether any job is due, so idle wake-ups skip run_pending entirely
+
+        Returns:
+            True if the next job's firing time has passed
+        """
+        idle = self._jobs.idle_seconds()
+        return idle is not None and idle <= 0
+
+    def _run_pending(self):
+        """Run due jobs, counting consecutive failures for the retry backoff"""
+        try:
+            self._jobs.run_pending()
+            self._failed_iters = 0
+        except Exception as e:
+            self._failed_iters += 1
+            logger.error("Error in scheduler loop: %s", e)
+
+    def _wait_timeout(self) -> float:
+        """
+        Get how long the scheduler loop may sleep
+
+        Returns:
+            Seconds until the next job is due, bounded by MAX_IDLE_SECONDS
+        """
+        # Sleep until the next job is due instead of polling every minute
+        idle = self._jobs.idle_seconds()
+        if idle is None:
+            idle = MAX_IDLE_SECONDS
+        elif idle <= 0:
+            # A job that raised stays due; retry it, backing off while it keeps failing
+            idle = self._retry_delay()
+        return min(idle, MAX_IDLE_SECONDS)
+
+    def _retry_delay(self) -> float:
+        """
+        Get the pause before retrying an overdue job
+
+        Returns:
+            Delay in seconds, growing with the number of consecutive failures
+        """
+        doublings = min(max(self._failed_iters - 1, 0), 16)
+        return min(RETRY_BASE_SECONDS * 2 ** doublings, MAX_RETRY_SECONDS)
+
+    def run_now(self, task: Callable) -> "Future":
+        """
+        Run a task immediately in a background thread
+
+        Args:
+            task: Callable function to execute
+
+        Returns:
+            Future resolving to the task's return value (None if it raised)
+        """
+        logger.info("Running task immediately")
+        if self._executor is None:
+            # Imported here so daemon and CLI startup don't pay for it
+            from concurrent.futures import ThreadPoolExecutor
+
+            self._executor = ThreadPoolExecutor(
+                max_workers=RUN_NOW_WORKERS,
+                thread_name_prefix="paper-run"
+            )
+        return self._executor.submit(self._run_task, task)
+
+    def _run_task(self, task: Callable) -> Any:
+        """
+        Execute a task, logging instead of propagating its errors
 
         Args:
             task: Callable function to execute
+
+        Returns:
+            The task's return value, or None if it raised
         """
-        self.logger.info("Running task immediately")
         try:
-            task()
+            return task()
         except Exception as e:
-            self.logger.error(f"Error running task: {e}")
+            logger.error("Error running task: %s", e)
+            return None
 
     def get_next_run_time(self) -> Optional[datetime]:
         """
@@ -97,10 +498,12 @@ class PaperScheduler:
         Returns:
             Next run time as datetime, or None if no jobs scheduled
         """
-        next_run = schedule.next_run()
-        if next_run:
-            return next_run
-        return None
+        if self._cache_valid_until is None or datetime.now() >= self._cache_valid_until:
+            # The next run only changes when jobs are added, removed, or fire
+            self._cached_next_run = self._jobs.next_run()
+            self._cache_valid_until = self._cached_next_run or datetime.max
+
+        return self._cached_next_run
 
     @staticmethod
     def create_cron_entry(hour: int = 10, minute: int = 0, script_path: str = "main.py") -> str:
@@ -115,7 +518,7 @@ class PaperScheduler:
         Returns:
             Crontab entry string
         """
-        return f"{minute} {hour} * * * cd /path/to/arxiv-paper-collector && /usr/bin/python3 {script_path} >> output/cron.log 2>&1"
+        return _cron_entry(hour, minute, script_path)
 
     @staticmethod
     def get_systemd_service_content(project_path: str = "/path/to/arxiv-paper-collector") -> str:
@@ -128,18 +531,4 @@ class PaperScheduler:
         Returns:
             Systemd service file content
         """
-        return f"""[Unit]
-Description=ArXiv Paper Collector Service
-After=network.target
-
-[Service]
-Type=simple
-User=your_username
-WorkingDirectory={project_path}
-ExecStart=/usr/bin/python3 {project_path}/main.py --daemon
-Restart=always
-RestartSec=10
-
-[Install]
-WantedBy=multi-user.target
-"""
+        return _systemd_service_content(project_path)
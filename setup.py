@@ -3,15 +3,15 @@ ArXiv Paper Collector - Setup Script
 Install with: pip install -e .
 """
 
-from setuptools import setup, find_packages
-import os
+from pathlib import Path
+
+from setuptools import setup
 
 # Read README for long description
 def read_readme():
-    readme_path = os.path.join(os.path.dirname(__file__), 'README.md')
-    if os.path.exists(readme_path):
-        with open(readme_path, 'r', encoding='utf-8') as f:
-            return f.read()
+    readme_path = Path(__file__).parent / 'README.md'
+    if readme_path.exists():
+        return readme_path.read_bytes().decode('utf-8')
     return ''
 
 setup(
@@ -23,7 +23,8 @@ setup(
     long_description=read_readme(),
     long_description_content_type='text/markdown',
     url='https://github.com/YOUR_USERNAME/arxiv-paper-collector',
-    packages=find_packages(),
+    packages=['modules'],
+    py_modules=['main'],
     classifiers=[
         'Development Status :: 4 - Beta',
         'Intended Audience :: Science/Research',
@@ -38,12 +39,11 @@ setup(
     ],
     python_requires='>=3.8',
     install_requires=[
-        'arxiv>=1.4.0',
-        'PyYAML>=6.0',
-        'Jinja2>=3.1.0',
-        'python-dateutil>=2.8.0',
-        'colorlog>=6.7.0',
-        'schedule>=1.2.0',
+        'arxiv>=1.4.0,<5',
+        'PyYAML>=6.0,<7',
+        'Jinja2>=3.1.0,<4',
+        'python-dateutil>=2.8.0,<3',
+        'colorlog>=6.7.0,<7',
     ],
     extras_require={
         'dev': [
@@ -51,6 +51,10 @@ setup(
             'black>=22.0.0',
             'flake8>=4.0.0',
         ],
+        'fast': [
+            'pyahocorasick>=2.0.0,<3',
+            'orjson>=3.6.0,<4',
+        ],
     },
     entry_points={
         'console_scripts': [
@@ -59,8 +63,9 @@ setup(
     },
     include_package_data=True,
     package_data={
-        'arxiv_paper_collector': ['templates/*.tex', 'config.yaml'],
+        'modules': ['templates/*.tex'],
     },
+    # Templates are read from the filesystem relative to the sources
     zip_safe=False,
     keywords='arxiv papers academic research automation latex pdf machine-learning',
 )
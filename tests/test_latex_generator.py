@@ -0,0 +1,44 @@
+"""
+Tests for the LaTeX generator
+"""
+
+from datetime import datetime, timezone
+
+from modules.latex_generator import LatexGenerator
+
+
+def _sample_papers():
+    return {
+        "machine_learning": [{
+            "title": "Learning 100% of the_things",
+            "authors": ["Ada Lovelace", "Alan Turing"],
+            "summary": "An abstract with $math$ & specials.",
+            "published": datetime(2024, 1, 2, tzinfo=timezone.utc),
+            "arxiv_id": "2401.00001v1",
+            "url": "http://arxiv.org/abs/2401.00001v1",
+            "categories": ["cs.LG", "cs.AI"],
+        }]
+    }
+
+
+def test_missing_template_falls_back_to_builtin(tmp_path):
+    generator = LatexGenerator(template_name="missing.tex")
+    output_path = tmp_path / "report.tex"
+
+    generator.generate_latex(_sample_papers(), str(output_path), title="Report")
+
+    content = output_path.read_text(encoding="utf-8")
+    assert content.lstrip().startswith(r"\documentclass")
+    assert r"Learning 100\% of the\_things" in content
+    assert "Ada Lovelace, Alan Turing" in content
+    assert r"\end{document}" in content
+
+
+def test_bundled_template_renders(tmp_path):
+    output_path = tmp_path / "report.tex"
+
+    LatexGenerator().generate_latex(_sample_papers(), str(output_path), title="Report")
+
+    content = output_path.read_text(encoding="utf-8")
+    assert "cs.LG, cs.AI" in content
+    assert r"\end{document}" in content